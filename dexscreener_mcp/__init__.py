@@ -8,6 +8,13 @@ __version__ = "1.0.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from .server import DexScreenerMCPServer
+__all__ = ["DexScreenerMCPServer"]
 
-__all__ = ["DexScreenerMCPServer"]
\ No newline at end of file
+
+def __getattr__(name: str):
+    """Import the server lazily so client/types users don't load the MCP SDK."""
+    if name == "DexScreenerMCPServer":
+        from .server import DexScreenerMCPServer
+
+        return DexScreenerMCPServer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,108 @@
+"""
+Expiring LRU cache that coalesces concurrent loads of the same key.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Least recently used cache whose entries expire after a per-entry TTL.
+    
+    Concurrent ``load`` calls for the same key share one background task, so
+    only one load runs per key and cancelling one caller doesn't abort it for
+    the others.
+    """
+    
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        
+        # key -> (monotonic expiry, value), least recently used first
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        
+        # Loads currently running, shared by concurrent callers of a key
+        self._inflight: "Dict[Hashable, asyncio.Task]" = {}
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+    
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._entries)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @property
+    def inflight(self) -> int:
+        """Number of keys with a load currently running."""
+        return len(self._inflight)
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a value if it is cached and not expired, else None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        if entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            return entry[1]
+        
+        del self._entries[key]
+        return None
+    
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store a value for ``ttl`` seconds, evicting least recently used entries."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    async def load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float,
+    ) -> Any:
+        """
+        Run ``loader`` for a key, or join the run already in flight for it.
+        
+        The result is cached for ``ttl`` seconds; exceptions are raised to
+        every caller and not cached.
+        
+        Args:
+            key: Cache key
+            loader: Coroutine function producing the value
+            ttl: Seconds to keep the loaded value
+        
+        Returns:
+            The loaded value
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run(key, loader, ttl))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        
+        return await asyncio.shield(task)
+    
+    async def _run(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float,
+    ) -> Any:
+        """Load a value and cache it for later callers."""
+        value = await loader()
+        self.set(key, value, ttl)
+        return value
+    
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        """Drop a finished load from the in-flight map."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark errors as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,32 @@
+"""
+JSON encoding helpers that prefer orjson and fall back to the standard library.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+if orjson is not None:
+
+    def dumps(obj: Any) -> str:
+        """Serialize to compact JSON, stringifying unknown types."""
+        return orjson.dumps(obj, default=str).decode()
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+else:  # pragma: no cover - optional speedup
+
+    def dumps(obj: Any) -> str:
+        """Serialize to compact JSON, stringifying unknown types."""
+        return json.dumps(obj, separators=(",", ":"), default=str)
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
@@ -3,24 +3,20 @@ DexScreener API client with rate limiting, caching, and error handling.
 """
 
 import asyncio
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Union
-from urllib.parse import quote
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Type, Union
 
 import httpx
 import structlog
-from asyncio_throttle import Throttler
-from pydantic import ValidationError
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from pydantic import BaseModel, ValidationError
 
+from . import _jsonx
+from ._cache import TTLCache
 from .types import (
     APIError,
     ChainId,
+    MultiplePairsResponse,
     PairInfo,
     PairResponse,
     RateLimitInfo,
@@ -40,9 +36,28 @@ except (OSError, ValueError):
 if _is_mcp_mode:
     import logging
     logging.disable(logging.CRITICAL)
+    
+    # structlog prints to stdout by default; filter levels below CRITICAL so
+    # log calls return immediately, and discard anything that gets through
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL),
+        logger_factory=structlog.ReturnLoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
 
 logger = structlog.get_logger(__name__)
 
+CacheKey = Union[str, Tuple[str, FrozenSet]]
+
+# Endpoint path templates, relative to the client's base_url
+_ENDPOINTS = {
+    "token": "tokens/{}",
+    "pair": "pairs/{}/{}",
+    "search": "search",
+    "multi": "pairs/{}/{}",
+    "trending": "tokens",
+}
+
 
 class DexScreenerAPIError(Exception):
     """Custom exception for DexScreener API errors."""
@@ -60,6 +75,8 @@ class DexScreenerClient:
     """
     
     BASE_URL = "https://api.dexscreener.com/latest/dex"
+    MAX_PAIRS_PER_REQUEST = 30  # DexScreener cap on comma-separated pairs
+    MAX_CONCURRENT_CHUNKS = 8   # parallel chunk requests per get_multiple_pairs call
     
     def __init__(
         self,
@@ -67,22 +84,37 @@ class DexScreenerClient:
         cache_ttl: int = 60,    # cache TTL in seconds
         timeout: int = 30,      # request timeout in seconds
         max_retries: int = 3,   # max retry attempts
+        max_cache_entries: int = 1000,  # LRU cache capacity
+        negative_cache_ttl: int = 30,   # TTL for cached 400/404 errors
     ):
+        if rate_limit <= 0:
+            raise ValueError(f"rate_limit must be positive, got {rate_limit}")
+        
         self.rate_limit = rate_limit
         self.cache_ttl = cache_ttl
         self.timeout = timeout
         self.max_retries = max_retries
+        self.negative_cache_ttl = negative_cache_ttl
         
-        # Rate limiting
-        self.throttler = Throttler(rate_limit=rate_limit, period=60)
+        # Rate limiting: token bucket refilled at rate_limit per minute
+        self._bucket_capacity = float(rate_limit)
+        self._tokens = float(rate_limit)
+        self._refill_rate = rate_limit / 60.0
+        self._last_refill = time.monotonic()
         
-        # Simple in-memory cache
-        self._cache: Dict[str, Dict] = {}
-        self._cache_timestamps: Dict[str, datetime] = {}
+        # In-memory LRU cache of parsed responses, shared by concurrent callers
+        self._cache = TTLCache(max_cache_entries)
         
         # HTTP client
         self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(timeout),
+            base_url=self.BASE_URL,
+            http2=True,
+            timeout=httpx.Timeout(timeout, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
             headers={
                 "User-Agent": "DexScreener-MCP-Server/1.0.0",
                 "Accept": "application/json",
@@ -107,95 +139,154 @@ class DexScreenerClient:
         await self.client.aclose()
         logger.info("DexScreener client closed")
     
-    def _get_cache_key(self, endpoint: str, params: Optional[Dict] = None) -> str:
-        """Generate cache key for endpoint and parameters."""
-        if params:
-            param_str = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
-            return f"{endpoint}?{param_str}"
-        return endpoint
-    
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cached data is still valid."""
-        if cache_key not in self._cache_timestamps:
-            return False
-        
-        cache_time = self._cache_timestamps[cache_key]
-        return datetime.now() - cache_time < timedelta(seconds=self.cache_ttl)
+    def _get_cache_key(self, endpoint: str, params: Optional[Dict] = None) -> CacheKey:
+        """Generate a hashable cache key for endpoint and parameters."""
+        if not params:
+            return endpoint
+        return (
+            endpoint,
+            frozenset(
+                (k, tuple(v) if isinstance(v, list) else v)
+                for k, v in params.items()
+            ),
+        )
     
-    def _get_cached_data(self, cache_key: str) -> Optional[Dict]:
+    def _get_cached_data(self, cache_key: CacheKey) -> Optional[Any]:
         """Get data from cache if valid."""
-        if self._is_cache_valid(cache_key):
+        data = self._cache.get(cache_key)
+        if data is not None:
             logger.debug("Cache hit", cache_key=cache_key)
-            return self._cache[cache_key]
-        
-        # Remove expired cache entries
-        if cache_key in self._cache:
-            del self._cache[cache_key]
-            del self._cache_timestamps[cache_key]
-            logger.debug("Cache expired", cache_key=cache_key)
-        
-        return None
+        return data
     
-    def _cache_data(self, cache_key: str, data: Dict) -> None:
-        """Store data in cache."""
-        self._cache[cache_key] = data
-        self._cache_timestamps[cache_key] = datetime.now()
+    def _cache_data(
+        self, cache_key: CacheKey, data: Any, ttl: Optional[float] = None
+    ) -> None:
+        """Store data in cache, evicting least recently used entries."""
+        self._cache.set(cache_key, data, self.cache_ttl if ttl is None else ttl)
         logger.debug("Data cached", cache_key=cache_key)
     
-    @retry(
-        retry=retry_if_exception_type((httpx.RequestError, httpx.HTTPStatusError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-    )
+    async def _acquire(self) -> None:
+        """Take a token from the rate limit bucket, waiting if it is empty."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self._bucket_capacity,
+                self._tokens + (now - self._last_refill) * self._refill_rate,
+            )
+            self._last_refill = now
+            
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            
+            await asyncio.sleep((1 - self._tokens) / self._refill_rate)
+    
     async def _make_request(
-        self, endpoint: str, params: Optional[Dict] = None
-    ) -> Dict:
-        """Make HTTP request with retry logic and rate limiting."""
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        model_cls: Optional[Type[BaseModel]] = None,
+    ) -> Any:
+        """
+        Make cached HTTP request, coalescing concurrent identical calls.
+        
+        When ``model_cls`` is given the raw body is decoded straight into the
+        model and the instance is cached, so cache hits skip pydantic entirely.
+        """
         cache_key = self._get_cache_key(endpoint, params)
         
         # Check cache first
         cached_data = self._get_cached_data(cache_key)
         if cached_data is not None:
+            if isinstance(cached_data, DexScreenerAPIError):
+                raise DexScreenerAPIError(cached_data.message, cached_data.status_code)
             return cached_data
         
-        # Apply rate limiting
-        async with self.throttler:
-            url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
+        # Join an identical request that is already in flight, or start one
+        return await self._cache.load(
+            cache_key,
+            lambda: self._load(cache_key, endpoint, params, model_cls),
+            self.cache_ttl,
+        )
+    
+    async def _load(
+        self,
+        cache_key: CacheKey,
+        endpoint: str,
+        params: Optional[Dict],
+        model_cls: Optional[Type[BaseModel]],
+    ) -> Any:
+        """Fetch and decode an endpoint, negative-caching permanent failures."""
+        try:
+            content = await self._fetch(endpoint, params)
+        except DexScreenerAPIError as e:
+            # Negative-cache permanent lookup failures (e.g. unknown address)
+            if e.status_code in (400, 404):
+                self._cache_data(cache_key, e, ttl=self.negative_cache_ttl)
+            raise
+        
+        if model_cls is not None:
+            # Parse and validate in one pass inside pydantic-core
+            return model_cls.model_validate_json(content)
+        return _jsonx.loads(content)
+    
+    async def _fetch(self, endpoint: str, params: Optional[Dict] = None) -> bytes:
+        """
+        Fetch the raw response body of an endpoint with retry logic and rate
+        limiting.
+        
+        Network errors, 429 and 5xx responses are retried with exponential
+        backoff; other 4xx responses are permanent and raised immediately.
+        """
+        attempts = max(1, self.max_retries)
+        
+        for attempt in range(1, attempts + 1):
+            # Apply rate limiting
+            await self._acquire()
             
-            logger.debug("Making API request", url=url, params=params)
+            logger.debug(
+                "Making API request", endpoint=endpoint, params=params, attempt=attempt
+            )
             
             try:
-                response = await self.client.get(url, params=params)
+                response = await self.client.get(endpoint, params=params)
                 response.raise_for_status()
                 
-                data = response.json()
-                
-                # Cache successful response
-                self._cache_data(cache_key, data)
-                
-                logger.info(
-                    "API request successful",
-                    url=url,
-                    status_code=response.status_code,
-                    response_size=len(str(data)),
-                )
-                
-                return data
-                
             except httpx.HTTPStatusError as e:
-                error_msg = f"HTTP {e.response.status_code}: {e.response.text}"
+                status_code = e.response.status_code
+                error_msg = f"HTTP {status_code}: {e.response.text}"
                 logger.error(
                     "API request failed",
-                    url=url,
-                    status_code=e.response.status_code,
+                    endpoint=endpoint,
+                    status_code=status_code,
                     error=error_msg,
+                    attempt=attempt,
                 )
-                raise DexScreenerAPIError(error_msg, e.response.status_code)
+                retryable = status_code == 429 or status_code >= 500
+                if not retryable or attempt == attempts:
+                    raise DexScreenerAPIError(error_msg, status_code)
                 
             except httpx.RequestError as e:
                 error_msg = f"Request failed: {str(e)}"
-                logger.error("Network error", url=url, error=error_msg)
-                raise DexScreenerAPIError(error_msg)
+                logger.error(
+                    "Network error", endpoint=endpoint, error=error_msg, attempt=attempt
+                )
+                if attempt == attempts:
+                    raise DexScreenerAPIError(error_msg)
+                
+            else:
+                logger.info(
+                    "API request successful",
+                    endpoint=endpoint,
+                    status_code=response.status_code,
+                    response_size=len(response.content),
+                )
+                
+                return response.content
+            
+            await asyncio.sleep(min(10, 2 ** (attempt - 1)))
+        
+        raise AssertionError("unreachable")  # pragma: no cover
     
     async def get_token_info(self, token_address: str) -> TokenResponse:
         """
@@ -212,8 +303,9 @@ class DexScreenerClient:
             ValidationError: If response validation fails
         """
         try:
-            data = await self._make_request(f"tokens/{token_address}")
-            return TokenResponse(**data)
+            return await self._make_request(
+                _ENDPOINTS["token"].format(token_address), model_cls=TokenResponse
+            )
         except ValidationError as e:
             logger.error("Token response validation failed", error=str(e))
             raise DexScreenerAPIError(f"Invalid response format: {str(e)}")
@@ -234,8 +326,10 @@ class DexScreenerClient:
             ValidationError: If response validation fails
         """
         try:
-            data = await self._make_request(f"pairs/{chain_id}/{pair_address}")
-            return PairResponse(**data)
+            return await self._make_request(
+                _ENDPOINTS["pair"].format(chain_id, pair_address),
+                model_cls=PairResponse,
+            )
         except ValidationError as e:
             logger.error("Pair response validation failed", error=str(e))
             raise DexScreenerAPIError(f"Invalid response format: {str(e)}")
@@ -264,8 +358,9 @@ class DexScreenerClient:
             params["limit"] = str(limit)
         
         try:
-            data = await self._make_request("search", params)
-            return SearchResult(**data)
+            return await self._make_request(
+                _ENDPOINTS["search"], params, model_cls=SearchResult
+            )
         except ValidationError as e:
             logger.error("Search response validation failed", error=str(e))
             raise DexScreenerAPIError(f"Invalid response format: {str(e)}")
@@ -284,11 +379,10 @@ class DexScreenerClient:
             DexScreenerAPIError: If API request fails
             ValidationError: If response validation fails
         """
-        endpoint = chain_id if chain_id else "tokens"
+        endpoint = chain_id if chain_id else _ENDPOINTS["trending"]
         
         try:
-            data = await self._make_request(endpoint)
-            return TrendingResponse(**data)
+            return await self._make_request(endpoint, model_cls=TrendingResponse)
         except ValidationError as e:
             logger.error("Trending response validation failed", error=str(e))
             raise DexScreenerAPIError(f"Invalid response format: {str(e)}")
@@ -298,7 +392,12 @@ class DexScreenerClient:
         pair_addresses: List[str]
     ) -> List[PairInfo]:
         """
-        Get information for multiple pairs in a single request.
+        Get information for multiple pairs.
+        
+        Addresses are grouped by chain and split into chunks of
+        ``MAX_PAIRS_PER_REQUEST``; chunks are fetched concurrently (at most
+        ``MAX_CONCURRENT_CHUNKS`` at once) and each is cached and rate limited
+        on its own.
         
         Args:
             pair_addresses: List of pair addresses in format "chain:address"
@@ -307,19 +406,44 @@ class DexScreenerClient:
             List of PairInfo objects
             
         Raises:
+            ValueError: If an address is not in "chain:address" format
             DexScreenerAPIError: If API request fails
             ValidationError: If response validation fails
         """
         if not pair_addresses:
             return []
         
-        # DexScreener accepts comma-separated pair addresses
-        addresses_param = ",".join(pair_addresses)
+        # Group by chain, keeping first-seen order of chains and addresses
+        by_chain: Dict[str, List[str]] = {}
+        for pair_address in pair_addresses:
+            chain_id, sep, address = pair_address.partition(":")
+            if not sep or not chain_id or not address:
+                raise ValueError(
+                    f"Invalid pair address {pair_address!r}, expected 'chain:address'"
+                )
+            by_chain.setdefault(chain_id, []).append(address)
+        
+        # DexScreener accepts comma-separated pair addresses per chain, up to a cap
+        size = self.MAX_PAIRS_PER_REQUEST
+        chunks = [
+            (chain_id, addresses[i:i + size])
+            for chain_id, addresses in by_chain.items()
+            for i in range(0, len(addresses), size)
+        ]
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CHUNKS)
+        
+        async def fetch_chunk(chain_id: str, chunk: List[str]) -> MultiplePairsResponse:
+            async with semaphore:
+                return await self._make_request(
+                    _ENDPOINTS["multi"].format(chain_id, ",".join(chunk)),
+                    model_cls=MultiplePairsResponse,
+                )
         
         try:
-            data = await self._make_request(f"pairs/{addresses_param}")
-            pairs_data = data.get("pairs", [])
-            return [PairInfo(**pair) for pair in pairs_data]
+            responses = await asyncio.gather(
+                *(fetch_chunk(chain_id, chunk) for chain_id, chunk in chunks)
+            )
+            return [pair for response in responses for pair in response.pairs]
         except ValidationError as e:
             logger.error("Multiple pairs response validation failed", error=str(e))
             raise DexScreenerAPIError(f"Invalid response format: {str(e)}")
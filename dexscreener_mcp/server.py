@@ -3,28 +3,340 @@ DexScreener MCP Server implementation with comprehensive tools and error handlin
 """
 
 import asyncio
-import json
+import logging
 import os
-from typing import Any, Dict, List, Optional, Sequence
+import sys
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Set, Tuple, Type, Union
 
 import structlog
 from mcp.server import Server, NotificationOptions
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import (
-    CallToolRequest,
     CallToolResult,
     ListToolsRequest,
     TextContent,
     Tool,
 )
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
-from .client import DexScreenerAPIError, DexScreenerClient
-from .types import ChainId
+from . import _jsonx
+from ._cache import TTLCache
+from .client import DexScreenerAPIError, DexScreenerClient, _is_mcp_mode
+from .types import (
+    ChainId,
+    MultiplePairsArgs,
+    NoArgs,
+    PairInfo,
+    PairInfoArgs,
+    PairResponse,
+    SearchTokensArgs,
+    TokenInfoArgs,
+    TrendingPairsArgs,
+)
 
 logger = structlog.get_logger(__name__)
 
+# Standalone log threshold; unknown LOG_LEVEL values fall back to INFO
+_LOG_LEVEL = logging.getLevelName(os.getenv("LOG_LEVEL", "INFO").upper())
+if not isinstance(_LOG_LEVEL, int):
+    _LOG_LEVEL = logging.INFO
+
+# Input schema for tools without arguments. Tool copies only the top-level
+# dict on validation, so the nested properties/required objects are shared.
+_EMPTY_OBJECT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {},
+    "required": [],
+}
+
+# Tool definitions are static, so build them once at import
+_TOOLS: List[Tool] = [
+    Tool(
+        name="get_token_info",
+        description="Get comprehensive token information and trading pairs",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "token_address": {
+                    "type": "string",
+                    "description": "Token contract address (e.g., 0x...)",
+                }
+            },
+            "required": ["token_address"],
+        },
+    ),
+    Tool(
+        name="get_pair_info",
+        description="Get detailed trading pair information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "chain_id": {
+                    "type": "string",
+                    "description": "Blockchain identifier (e.g., ethereum, bsc, polygon)",
+                },
+                "pair_address": {
+                    "type": "string",
+                    "description": "Trading pair contract address",
+                },
+            },
+            "required": ["chain_id", "pair_address"],
+        },
+    ),
+    Tool(
+        name="search_tokens",
+        description=(
+            "Search for tokens and trading pairs by name, symbol, or address. "
+            "Returns {pairs, total}, where total counts all matches before paging"
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (token name, symbol, or address)",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results (optional, default: all)",
+                    "minimum": 1,
+                    "maximum": 100,
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "Number of results to skip (optional, default: 0)",
+                    "minimum": 0,
+                },
+            },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="get_trending_pairs",
+        description="Get trending/popular trading pairs, optionally filtered by blockchain",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "chain_id": {
+                    "type": "string",
+                    "description": "Optional blockchain identifier to filter by",
+                }
+            },
+            "required": [],
+        },
+    ),
+    Tool(
+        name="get_multiple_pairs",
+        description="Get information for multiple trading pairs in a batch request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pair_addresses": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of pair addresses in format 'chain:address'",
+                    "minItems": 1,
+                    "maxItems": 30,
+                }
+            },
+            "required": ["pair_addresses"],
+        },
+    ),
+    Tool(
+        name="get_supported_chains",
+        description="Get list of supported blockchain networks",
+        inputSchema=_EMPTY_OBJECT_SCHEMA,
+    ),
+    Tool(
+        name="get_rate_limit_info",
+        description="Get current API rate limit status and information",
+        inputSchema=_EMPTY_OBJECT_SCHEMA,
+    ),
+]
+
+# Static chain metadata returned by get_supported_chains
+_SUPPORTED_CHAINS = (
+    {
+        "id": "ethereum",
+        "name": "Ethereum",
+        "native_currency": "ETH",
+        "explorer": "https://etherscan.io",
+    },
+    {
+        "id": "bsc",
+        "name": "BNB Smart Chain",
+        "native_currency": "BNB",
+        "explorer": "https://bscscan.com",
+    },
+    {
+        "id": "polygon",
+        "name": "Polygon",
+        "native_currency": "MATIC",
+        "explorer": "https://polygonscan.com",
+    },
+    {
+        "id": "avalanche",
+        "name": "Avalanche",
+        "native_currency": "AVAX",
+        "explorer": "https://snowtrace.io",
+    },
+    {
+        "id": "arbitrum",
+        "name": "Arbitrum One",
+        "native_currency": "ETH",
+        "explorer": "https://arbiscan.io",
+    },
+    {
+        "id": "optimism",
+        "name": "Optimism",
+        "native_currency": "ETH",
+        "explorer": "https://optimistic.etherscan.io",
+    },
+    {
+        "id": "base",
+        "name": "Base",
+        "native_currency": "ETH",
+        "explorer": "https://basescan.org",
+    },
+    {
+        "id": "fantom",
+        "name": "Fantom",
+        "native_currency": "FTM",
+        "explorer": "https://ftmscan.com",
+    },
+)
+
+
+# Tools whose results depend only on their arguments over short windows
+_CACHEABLE_TOOLS = frozenset(
+    {
+        "get_token_info",
+        "get_pair_info",
+        "search_tokens",
+        "get_trending_pairs",
+        "get_multiple_pairs",
+    }
+)
+
+# Argument models, validated once per call before dispatch
+_ARG_MODELS: Dict[str, Type[BaseModel]] = {
+    "get_token_info": TokenInfoArgs,
+    "get_pair_info": PairInfoArgs,
+    "search_tokens": SearchTokensArgs,
+    "get_trending_pairs": TrendingPairsArgs,
+    "get_multiple_pairs": MultiplePairsArgs,
+    "get_supported_chains": NoArgs,
+    "get_rate_limit_info": NoArgs,
+}
+
+ToolHandler = Callable[[Any], Awaitable[Dict[str, Any]]]
+
+
+_logging_configured = False
+
+
+def _configure_logging() -> None:
+    """
+    Configure structured logging to stderr, once per process, in standalone
+    mode. MCP mode logging is already silenced when the client is imported.
+    """
+    global _logging_configured
+    if _logging_configured or _is_mcp_mode:
+        return
+    
+    structlog.configure(
+        processors=[
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.add_log_level,
+            structlog.processors.JSONRenderer(),
+        ],
+        logger_factory=structlog.WriteLoggerFactory(file=sys.stderr),
+        # Below-threshold calls (e.g. per-request debug logs) are no-ops
+        wrapper_class=structlog.make_filtering_bound_logger(_LOG_LEVEL),
+        cache_logger_on_first_use=True,
+    )
+    _logging_configured = True
+
+
+def _pair_key(chain_id: str, pair_address: str) -> Tuple[str, str]:
+    """
+    Normalize a pair lookup for matching against API results.
+    
+    Chain ids are case-insensitive, as are 0x hex addresses; other address
+    formats (e.g. base58 on Solana) are case-sensitive and compared as-is.
+    """
+    if pair_address[:2].lower() == "0x":
+        pair_address = pair_address.lower()
+    return chain_id.lower(), pair_address
+
+
+class _BatchProcessor:
+    """
+    Collect items submitted within a short window and resolve them together.
+    
+    Each ``submit`` call awaits its own result while ``flush`` receives the
+    whole batch, once ``max_size`` items are pending or ``max_wait`` seconds
+    after the first one arrived, whichever comes first. ``flush`` may return
+    an exception in place of a result to fail just that item.
+    """
+    
+    def __init__(
+        self,
+        flush: Callable[[List[Hashable]], Awaitable[List[Any]]],
+        max_size: int,
+        max_wait: float,
+    ):
+        self._flush = flush
+        self._max_size = max_size
+        self._max_wait = max_wait
+        self._pending: "List[Tuple[Hashable, asyncio.Future]]" = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: "Set[asyncio.Task]" = set()
+    
+    async def submit(self, item: Hashable) -> Any:
+        """Queue an item for the next batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        
+        if len(self._pending) >= self._max_size:
+            self._flush_pending()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait, self._flush_pending)
+        
+        return await future
+    
+    def _flush_pending(self) -> None:
+        """Hand the pending items to a background flush task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        
+        batch, self._pending = self._pending, []
+        if batch:
+            # Keep a reference so the task isn't garbage collected mid-flight
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _run_batch(self, batch: "List[Tuple[Hashable, asyncio.Future]]") -> None:
+        """Run flush for a batch and resolve each caller's future."""
+        try:
+            results = await self._flush([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
 
 class DexScreenerMCPServer:
     """
@@ -32,18 +344,53 @@ class DexScreenerMCPServer:
     error handling, and best practices implementation.
     """
     
+    RESULT_CACHE_TTL = 10  # seconds to reuse serialized read-only tool results
+    MAX_CACHED_RESULTS = 256
+    PAIR_BATCH_WAIT = 0.005  # seconds to collect get_pair_info calls into a batch
+    
     def __init__(self):
+        _configure_logging()
+        
         self.client: Optional[DexScreenerClient] = None
         self.server = Server("dexscreener-mcp-server")
+        
+        # Tool name -> handler routing table
+        self._dispatch: Dict[str, ToolHandler] = {
+            "get_token_info": self._get_token_info,
+            "get_pair_info": self._get_pair_info,
+            "search_tokens": self._search_tokens,
+            "get_trending_pairs": self._get_trending_pairs,
+            "get_multiple_pairs": self._get_multiple_pairs,
+            "get_rate_limit_info": self._get_rate_limit_info,
+        }
+        
+        # Prebuilt results for tools whose output never changes
+        self._static_results: Dict[str, CallToolResult] = {
+            "get_supported_chains": CallToolResult(
+                content=[
+                    TextContent(
+                        type="text",
+                        text=_jsonx.dumps({"supported_chains": _SUPPORTED_CHAINS}),
+                    )
+                ]
+            ),
+        }
+        
+        # Serialized results of read-only tools, shared by identical callers
+        self._result_cache = TTLCache(self.MAX_CACHED_RESULTS)
+        
+        # Concurrent get_pair_info calls share multi-pair upstream requests
+        self._pair_batcher = _BatchProcessor(
+            flush=self._flush_pair_batch,
+            max_size=DexScreenerClient.MAX_PAIRS_PER_REQUEST,
+            max_wait=self.PAIR_BATCH_WAIT,
+        )
+        
         self._setup_handlers()
         
         # Only log in standalone mode to avoid MCP stdout pollution
-        import sys
-        try:
-            if sys.stdin.isatty():
-                logger.info("DexScreener MCP Server initialized")
-        except (OSError, ValueError):
-            pass
+        if not _is_mcp_mode:
+            logger.info("DexScreener MCP Server initialized")
     
     def _setup_handlers(self):
         """Set up MCP server handlers."""
@@ -51,166 +398,45 @@ class DexScreenerMCPServer:
         @self.server.list_tools()
         async def list_tools() -> List[Tool]:
             """List available DexScreener tools."""
-            tools = [
-                Tool(
-                    name="get_token_info",
-                    description="Get comprehensive token information and trading pairs",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "token_address": {
-                                "type": "string",
-                                "description": "Token contract address (e.g., 0x...)",
-                            }
-                        },
-                        "required": ["token_address"],
-                    },
-                ),
-                Tool(
-                    name="get_pair_info",
-                    description="Get detailed trading pair information",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "chain_id": {
-                                "type": "string",
-                                "description": "Blockchain identifier (e.g., ethereum, bsc, polygon)",
-                            },
-                            "pair_address": {
-                                "type": "string",
-                                "description": "Trading pair contract address",
-                            },
-                        },
-                        "required": ["chain_id", "pair_address"],
-                    },
-                ),
-                Tool(
-                    name="search_tokens",
-                    description="Search for tokens and trading pairs by name, symbol, or address",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "Search query (token name, symbol, or address)",
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of results (optional, default: 20)",
-                                "minimum": 1,
-                                "maximum": 100,
-                            },
-                        },
-                        "required": ["query"],
-                    },
-                ),
-                Tool(
-                    name="get_trending_pairs",
-                    description="Get trending/popular trading pairs, optionally filtered by blockchain",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "chain_id": {
-                                "type": "string",
-                                "description": "Optional blockchain identifier to filter by",
-                            }
-                        },
-                        "required": [],
-                    },
-                ),
-                Tool(
-                    name="get_multiple_pairs",
-                    description="Get information for multiple trading pairs in a batch request",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "pair_addresses": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "List of pair addresses in format 'chain:address'",
-                                "minItems": 1,
-                                "maxItems": 30,
-                            }
-                        },
-                        "required": ["pair_addresses"],
-                    },
-                ),
-                Tool(
-                    name="get_supported_chains",
-                    description="Get list of supported blockchain networks",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": [],
-                    },
-                ),
-                Tool(
-                    name="get_rate_limit_info",
-                    description="Get current API rate limit status and information",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": [],
-                    },
-                ),
-            ]
             # Only log in standalone mode
-            import sys
-            try:
-                if sys.stdin.isatty():
-                    logger.info(f"Returning {len(tools)} tools to MCP client")
-            except (OSError, ValueError):
-                pass
-            return tools
+            if not _is_mcp_mode:
+                logger.info(f"Returning {len(_TOOLS)} tools to MCP client")
+            return _TOOLS
         
         @self.server.call_tool()
-        async def call_tool(request: CallToolRequest) -> CallToolResult:
+        async def call_tool(tool_name: str, arguments: Dict[str, Any]) -> CallToolResult:
             """Handle tool calls with comprehensive error handling."""
             
             if not self.client:
                 self.client = DexScreenerClient()
             
             try:
-                tool_name = request.params.name
-                arguments = request.params.arguments or {}
+                arguments = arguments or {}
                 
-                # Only log in standalone mode
-                try:
-                    if sys.stdin.isatty():
-                        logger.info("Tool called", tool=tool_name, args=arguments)
-                except (OSError, ValueError):
-                    pass
+                arg_model = _ARG_MODELS.get(tool_name)
+                if arg_model is None:
+                    raise ValueError(f"Unknown tool: {tool_name}")
+                args = arg_model.model_validate(arguments)
+                
+                # Constant tools return a prebuilt result
+                static_result = self._static_results.get(tool_name)
+                if static_result is not None:
+                    return static_result
                 
                 # Route to appropriate tool handler
-                if tool_name == "get_token_info":
-                    result = await self._get_token_info(arguments)
-                elif tool_name == "get_pair_info":
-                    result = await self._get_pair_info(arguments)
-                elif tool_name == "search_tokens":
-                    result = await self._search_tokens(arguments)
-                elif tool_name == "get_trending_pairs":
-                    result = await self._get_trending_pairs(arguments)
-                elif tool_name == "get_multiple_pairs":
-                    result = await self._get_multiple_pairs(arguments)
-                elif tool_name == "get_supported_chains":
-                    result = await self._get_supported_chains(arguments)
-                elif tool_name == "get_rate_limit_info":
-                    result = await self._get_rate_limit_info(arguments)
-                else:
-                    raise ValueError(f"Unknown tool: {tool_name}")
+                text = await self._run_tool(tool_name, self._dispatch[tool_name], args)
                 
                 # Only log in standalone mode
-                try:
-                    if sys.stdin.isatty():
-                        logger.info("Tool completed successfully", tool=tool_name)
-                except (OSError, ValueError):
-                    pass
+                if not _is_mcp_mode:
+                    logger.info(
+                        "Tool completed successfully", tool=tool_name, args=arguments
+                    )
                 
                 return CallToolResult(
                     content=[
                         TextContent(
                             type="text",
-                            text=json.dumps(result, indent=2, default=str),
+                            text=text,
                         )
                     ]
                 )
@@ -221,11 +447,8 @@ class DexScreenerMCPServer:
                     error_msg += f" (Status: {e.status_code})"
                 
                 # Only log in standalone mode
-                try:
-                    if sys.stdin.isatty():
-                        logger.error("API error", tool=tool_name, error=error_msg)
-                except (OSError, ValueError):
-                    pass
+                if not _is_mcp_mode:
+                    logger.error("API error", tool=tool_name, error=error_msg)
                 
                 return CallToolResult(
                     content=[TextContent(type="text", text=error_msg)],
@@ -235,11 +458,8 @@ class DexScreenerMCPServer:
             except ValidationError as e:
                 error_msg = f"Validation Error: {str(e)}"
                 # Only log in standalone mode
-                try:
-                    if sys.stdin.isatty():
-                        logger.error("Validation error", tool=tool_name, error=error_msg)
-                except (OSError, ValueError):
-                    pass
+                if not _is_mcp_mode:
+                    logger.error("Validation error", tool=tool_name, error=error_msg)
                 
                 return CallToolResult(
                     content=[TextContent(type="text", text=error_msg)],
@@ -249,157 +469,173 @@ class DexScreenerMCPServer:
             except Exception as e:
                 error_msg = f"Unexpected Error: {str(e)}"
                 # Only log in standalone mode
-                try:
-                    if sys.stdin.isatty():
-                        logger.error("Unexpected error", tool=tool_name, error=error_msg, exc_info=True)
-                except (OSError, ValueError):
-                    pass
+                if not _is_mcp_mode:
+                    logger.error("Unexpected error", tool=tool_name, error=error_msg, exc_info=True)
                 
                 return CallToolResult(
                     content=[TextContent(type="text", text=error_msg)],
                     isError=True,
                 )
     
-    async def _get_token_info(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Get token information."""
-        token_address = args["token_address"]
+    async def _run_tool(
+        self,
+        tool_name: str,
+        handler: ToolHandler,
+        args: BaseModel,
+    ) -> str:
+        """
+        Run a tool handler and serialize its result.
+        
+        Read-only tools are served from the result cache when possible, and
+        concurrent identical calls share a single in-flight handler run.
+        """
+        cache_key = self._result_cache_key(tool_name, args)
+        if cache_key is None:
+            return _jsonx.dumps(await handler(args))
         
-        if not token_address:
-            raise ValueError("token_address is required")
+        text = self._result_cache.get(cache_key)
+        if text is not None:
+            return text
         
-        response = await self.client.get_token_info(token_address)
-        return response.dict()
+        async def run() -> str:
+            return _jsonx.dumps(await handler(args))
+        
+        return await self._result_cache.load(cache_key, run, self.RESULT_CACHE_TTL)
+    
+    def _result_cache_key(self, tool_name: str, args: BaseModel) -> Optional[Tuple]:
+        """Build a hashable result cache key, or None if the tool isn't cacheable."""
+        if tool_name not in _CACHEABLE_TOOLS:
+            return None
+        return (
+            tool_name,
+            frozenset(
+                (k, tuple(v) if isinstance(v, list) else v)
+                for k, v in args.model_dump().items()
+            ),
+        )
     
-    async def _get_pair_info(self, args: Dict[str, Any]) -> Dict[str, Any]:
+    async def _get_token_info(self, args: TokenInfoArgs) -> Dict[str, Any]:
+        """Get token information."""
+        response = await self.client.get_token_info(args.token_address)
+        return response.model_dump(mode="json")
+    
+    async def _get_pair_info(self, args: PairInfoArgs) -> Dict[str, Any]:
         """Get pair information."""
-        chain_id = args["chain_id"]
-        pair_address = args["pair_address"]
+        pair = await self._pair_batcher.submit((args.chain_id, args.pair_address))
+        return PairResponse(pair=pair).model_dump(mode="json")
+    
+    async def _flush_pair_batch(
+        self, keys: List[Tuple[str, str]]
+    ) -> List[Union[Optional[PairInfo], BaseException]]:
+        """
+        Fetch a batch of (chain_id, pair_address) lookups.
         
-        if not chain_id or not pair_address:
-            raise ValueError("chain_id and pair_address are required")
+        A lone lookup keeps using the single pair endpoint. Larger batches are
+        grouped by chain into multi-pair requests, which are fetched side by
+        side so a failing chain only fails the keys in its own request.
+        """
+        if len(keys) == 1:
+            response = await self.client.get_pair_info(*keys[0])
+            return [response.pair]
         
-        response = await self.client.get_pair_info(chain_id, pair_address)
-        return response.dict()
-    
-    async def _search_tokens(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Search for tokens."""
-        query = args["query"]
-        limit = args.get("limit")
+        # Keys that can't be joined into a multi-pair path go on their own
+        by_chain: Dict[str, List[Tuple[str, str]]] = {}
+        chunks: List[List[Tuple[str, str]]] = []
+        for key in dict.fromkeys(keys):
+            chain_id, pair_address = key
+            if ":" in chain_id or "," in pair_address:
+                chunks.append([key])
+            else:
+                by_chain.setdefault(chain_id, []).append(key)
         
-        if not query:
-            raise ValueError("query is required")
+        size = DexScreenerClient.MAX_PAIRS_PER_REQUEST
+        chunks.extend(
+            group[i:i + size]
+            for group in by_chain.values()
+            for i in range(0, len(group), size)
+        )
         
-        response = await self.client.search(query, limit)
-        return response.dict()
+        results: Dict[Tuple[str, str], Union[Optional[PairInfo], BaseException]] = {}
+        for chunk_results in await asyncio.gather(
+            *(self._fetch_pair_chunk(chunk) for chunk in chunks)
+        ):
+            results.update(chunk_results)
+        return [results[key] for key in keys]
     
-    async def _get_trending_pairs(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Get trending pairs."""
-        chain_id = args.get("chain_id")
+    async def _fetch_pair_chunk(
+        self, chunk: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Union[Optional[PairInfo], BaseException]]:
+        """
+        Fetch one chain's chunk of pair lookups, mapping each key to its pair
+        or to the error that failed it.
         
-        response = await self.client.get_trending_pairs(chain_id)
-        return response.dict()
-    
-    async def _get_multiple_pairs(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Get multiple pairs information."""
-        pair_addresses = args["pair_addresses"]
+        If the multi-pair request fails permanently (400/404 or a malformed
+        address), one bad key may be to blame, so each key is looked up on its
+        own. Transient failures (429, 5xx, network) fail the whole chunk
+        without refetching, since single lookups would hit the same errors.
+        """
+        if len(chunk) == 1:
+            try:
+                response = await self.client.get_pair_info(*chunk[0])
+            except Exception as e:
+                return {chunk[0]: e}
+            return {chunk[0]: response.pair}
         
-        if not pair_addresses:
-            raise ValueError("pair_addresses is required")
+        try:
+            pairs = await self.client.get_multiple_pairs(
+                [f"{chain_id}:{pair_address}" for chain_id, pair_address in chunk]
+            )
+        except Exception as e:
+            permanent = isinstance(e, ValueError) or (
+                isinstance(e, DexScreenerAPIError) and e.status_code in (400, 404)
+            )
+            if not permanent:
+                return {key: e for key in chunk}
+            
+            responses = await asyncio.gather(
+                *(self.client.get_pair_info(*key) for key in chunk),
+                return_exceptions=True,
+            )
+            return {
+                key: response if isinstance(response, BaseException) else response.pair
+                for key, response in zip(chunk, responses)
+            }
         
-        pairs = await self.client.get_multiple_pairs(pair_addresses)
-        return {"pairs": [pair.dict() for pair in pairs]}
+        by_key = {_pair_key(pair.chain_id, pair.pair_address): pair for pair in pairs}
+        return {key: by_key.get(_pair_key(*key)) for key in chunk}
     
-    async def _get_supported_chains(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Get supported blockchain networks."""
-        chains = [
-            {
-                "id": "ethereum",
-                "name": "Ethereum",
-                "native_currency": "ETH",
-                "explorer": "https://etherscan.io",
-            },
-            {
-                "id": "bsc",
-                "name": "BNB Smart Chain",
-                "native_currency": "BNB",
-                "explorer": "https://bscscan.com",
-            },
-            {
-                "id": "polygon",
-                "name": "Polygon",
-                "native_currency": "MATIC",
-                "explorer": "https://polygonscan.com",
-            },
-            {
-                "id": "avalanche",
-                "name": "Avalanche",
-                "native_currency": "AVAX",
-                "explorer": "https://snowtrace.io",
-            },
-            {
-                "id": "arbitrum",
-                "name": "Arbitrum One",
-                "native_currency": "ETH",
-                "explorer": "https://arbiscan.io",
-            },
-            {
-                "id": "optimism",
-                "name": "Optimism",
-                "native_currency": "ETH",
-                "explorer": "https://optimistic.etherscan.io",
-            },
-            {
-                "id": "base",
-                "name": "Base",
-                "native_currency": "ETH",
-                "explorer": "https://basescan.org",
-            },
-            {
-                "id": "fantom",
-                "name": "Fantom",
-                "native_currency": "FTM",
-                "explorer": "https://ftmscan.com",
-            },
-        ]
-        
-        return {"supported_chains": chains}
+    async def _search_tokens(self, args: SearchTokensArgs) -> Dict[str, Any]:
+        """Search for tokens, returning one page of the matching pairs."""
+        # Fetch the full result set once so every page shares a cache entry
+        response = await self.client.search(args.query)
+        end = None if args.limit is None else args.offset + args.limit
+        page = response.pairs[args.offset:end]
+        return {
+            "pairs": [pair.model_dump(mode="json") for pair in page],
+            "total": len(response.pairs),
+        }
     
-    async def _get_rate_limit_info(self, args: Dict[str, Any]) -> Dict[str, Any]:
+    async def _get_trending_pairs(self, args: TrendingPairsArgs) -> Dict[str, Any]:
+        """Get trending pairs."""
+        response = await self.client.get_trending_pairs(args.chain_id)
+        return response.model_dump(mode="json")
+    
+    async def _get_multiple_pairs(self, args: MultiplePairsArgs) -> Dict[str, Any]:
+        """Get multiple pairs information."""
+        pairs = await self.client.get_multiple_pairs(args.pair_addresses)
+        return {"pairs": [pair.model_dump(mode="json") for pair in pairs]}
+    
+    async def _get_rate_limit_info(self, args: NoArgs) -> Dict[str, Any]:
         """Get rate limit information."""
         rate_limit = self.client.get_rate_limit_info()
-        return rate_limit.dict()
+        return rate_limit.model_dump(mode="json")
     
     async def run(self):
         """Run the MCP server."""
         try:
-            # Configure structured logging to stderr only in standalone mode
-            import sys
-            
-            # Check if we're in MCP mode (stdin is a pipe) or standalone
-            is_mcp_mode = True
-            try:
-                is_mcp_mode = not sys.stdin.isatty()
-            except (OSError, ValueError):
-                # If stdin is closed or unavailable, assume MCP mode
-                is_mcp_mode = True
-            
-            # Only configure logging if we're not in MCP mode (stdin is tty = standalone)
-            if not is_mcp_mode:
-                structlog.configure(
-                    processors=[
-                        structlog.processors.TimeStamper(fmt="iso"),
-                        structlog.processors.add_log_level,
-                        structlog.processors.JSONRenderer(),
-                    ],
-                    logger_factory=structlog.WriteLoggerFactory(file=sys.stderr),
-                    wrapper_class=structlog.BoundLogger,
-                    cache_logger_on_first_use=True,
-                )
+            # Only log in standalone mode
+            if not _is_mcp_mode:
                 logger.info("Starting DexScreener MCP Server")
-            else:
-                # In MCP mode, disable all logging to avoid stdout pollution
-                import logging
-                logging.disable(logging.CRITICAL)
             
             async with stdio_server() as (read_stream, write_stream):
                 await self.server.run(
@@ -416,24 +652,15 @@ class DexScreenerMCPServer:
                 )
         except Exception as e:
             # Only log in standalone mode
-            try:
-                if sys.stdin.isatty():
-                    logger.error("Server error", error=str(e), exc_info=True)
-            except (OSError, ValueError):
-                pass
+            if not _is_mcp_mode:
+                logger.error("Server error", error=str(e), exc_info=True)
             raise
         finally:
             if self.client:
                 await self.client.close()
             # Only log in standalone mode
-            import sys
-            try:
-                if not sys.stdin.isatty():
-                    pass  # MCP mode - no logging
-                else:
-                    logger.info("DexScreener MCP Server stopped")
-            except (OSError, ValueError):
-                pass  # stdin unavailable - assume MCP mode
+            if not _is_mcp_mode:
+                logger.info("DexScreener MCP Server stopped")
 
 
 async def async_main():
@@ -442,18 +669,19 @@ async def async_main():
     await server.run()
 
 
+def _run_event_loop(main_coro: Awaitable[None]) -> None:
+    """Run the coroutine on uvloop when it is installed, else on asyncio's loop."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main_coro)
+    else:
+        uvloop.run(main_coro)
+
+
 def main():
     """Synchronous entry point for the MCP server (used by CLI)."""
-    import sys
-    import os
-    
-    # Check if we're running in MCP mode (stdin is a pipe) or standalone
-    is_mcp_mode = True
-    try:
-        is_mcp_mode = not sys.stdin.isatty()
-    except (OSError, ValueError):
-        # If stdin is closed or unavailable, assume MCP mode
-        is_mcp_mode = True
+    is_mcp_mode = _is_mcp_mode
     
     if not is_mcp_mode:
         # Only print messages when running standalone (for debugging)
@@ -465,7 +693,7 @@ def main():
         print("⏳ Waiting for MCP client connection...")
     
     try:
-        asyncio.run(async_main())
+        _run_event_loop(async_main())
     except KeyboardInterrupt:
         if not is_mcp_mode:
             print("\n👋 Server interrupted by user")
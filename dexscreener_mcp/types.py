@@ -4,12 +4,30 @@ Type definitions for DexScreener API responses.
 
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, HttpUrl, validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
 
 
-class TokenInfo(BaseModel):
+@lru_cache(maxsize=1024)
+def _timestamp_to_datetime(ms: Union[int, float]) -> datetime:
+    """
+    Convert a per-pair millisecond timestamp. Values rarely repeat within one
+    response; the memo pays off when the same pairs are parsed again after a
+    cache miss.
+    """
+    return datetime.fromtimestamp(ms / 1000)
+
+
+class FrozenModel(BaseModel):
+    """Immutable base for API models, which are cached and shared between callers."""
+    
+    # API payloads use camelCase aliases; field names work too when building models in code
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
+
+class TokenInfo(FrozenModel):
     """Token information model."""
     
     address: str = Field(..., description="Token contract address")
@@ -19,7 +37,7 @@ class TokenInfo(BaseModel):
     logo_uri: Optional[HttpUrl] = Field(None, alias="logoURI", description="Token logo URL")
 
 
-class PairInfo(BaseModel):
+class PairInfo(FrozenModel):
     """Trading pair information model."""
     
     chain_id: str = Field(..., alias="chainId", description="Blockchain chain ID")
@@ -43,32 +61,39 @@ class PairInfo(BaseModel):
     
     pair_created_at: Optional[datetime] = Field(None, alias="pairCreatedAt", description="Pair creation timestamp")
     
-    @validator("pair_created_at", pre=True)
+    @field_validator("pair_created_at", mode="before")
+    @classmethod
     def parse_timestamp(cls, v):
         if isinstance(v, (int, float)):
-            return datetime.fromtimestamp(v / 1000)  # Convert milliseconds to seconds
+            return _timestamp_to_datetime(v)
         return v
 
 
-class SearchResult(BaseModel):
+class SearchResult(FrozenModel):
     """Search result model."""
     
     pairs: List[PairInfo] = Field(default_factory=list, description="Found trading pairs")
 
 
-class TokenResponse(BaseModel):
+class TokenResponse(FrozenModel):
     """Token API response model."""
     
     pairs: List[PairInfo] = Field(default_factory=list, description="Token trading pairs")
 
 
-class PairResponse(BaseModel):
+class PairResponse(FrozenModel):
     """Single pair API response model."""
     
     pair: Optional[PairInfo] = Field(None, description="Pair information")
 
 
-class TrendingResponse(BaseModel):
+class MultiplePairsResponse(FrozenModel):
+    """Multiple pairs API response model."""
+    
+    pairs: List[PairInfo] = Field(default_factory=list, description="Requested pairs")
+
+
+class TrendingResponse(FrozenModel):
     """Trending pairs response model."""
     
     pairs: List[PairInfo] = Field(default_factory=list, description="Trending pairs")
@@ -89,6 +114,45 @@ class APIError(BaseModel):
     status_code: int = Field(..., description="HTTP status code")
 
 
+class NoArgs(BaseModel):
+    """Arguments for tools that take no input."""
+
+
+class TokenInfoArgs(BaseModel):
+    """Arguments for the get_token_info tool."""
+    
+    token_address: str = Field(..., min_length=1, description="Token contract address")
+
+
+class PairInfoArgs(BaseModel):
+    """Arguments for the get_pair_info tool."""
+    
+    chain_id: str = Field(..., min_length=1, description="Blockchain identifier")
+    pair_address: str = Field(..., min_length=1, description="Pair contract address")
+
+
+class SearchTokensArgs(BaseModel):
+    """Arguments for the search_tokens tool."""
+    
+    query: str = Field(..., min_length=1, description="Search query")
+    limit: Optional[int] = Field(None, ge=1, le=100, description="Maximum number of results")
+    offset: int = Field(0, ge=0, description="Number of results to skip")
+
+
+class TrendingPairsArgs(BaseModel):
+    """Arguments for the get_trending_pairs tool."""
+    
+    chain_id: Optional[str] = Field(None, description="Blockchain identifier to filter by")
+
+
+class MultiplePairsArgs(BaseModel):
+    """Arguments for the get_multiple_pairs tool."""
+    
+    pair_addresses: List[str] = Field(
+        ..., min_length=1, max_length=30, description="Pair addresses as 'chain:address'"
+    )
+
+
 class RateLimitInfo(BaseModel):
     """Rate limit information."""
     
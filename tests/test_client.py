@@ -2,12 +2,26 @@
 Tests for DexScreener API client.
 """
 
+import asyncio
+import json
+import time
+
+import httpx
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime
+from pydantic import ValidationError
 
 from dexscreener_mcp.client import DexScreenerClient, DexScreenerAPIError
-from dexscreener_mcp.types import TokenResponse, PairResponse
+from dexscreener_mcp.types import PairInfo, PairResponse, TokenResponse
+
+
+async def _install_transport(client, handler):
+    """Route the client's HTTP traffic through a mock handler."""
+    await client.client.aclose()
+    client.client = httpx.AsyncClient(
+        base_url=client.BASE_URL, transport=httpx.MockTransport(handler)
+    )
 
 
 class TestDexScreenerClient:
@@ -20,6 +34,12 @@ class TestDexScreenerClient:
         yield client
         await client.close()
     
+    @pytest.fixture
+    def mock_fetch(self, client):
+        """Replace the client's HTTP fetch with an AsyncMock."""
+        client._fetch = AsyncMock()
+        return client._fetch
+    
     @pytest.mark.asyncio
     async def test_client_initialization(self, client):
         """Test client initialization."""
@@ -27,14 +47,23 @@ class TestDexScreenerClient:
         assert client.cache_ttl == 10
         assert client.BASE_URL == "https://api.dexscreener.com/latest/dex"
     
+    @pytest.mark.parametrize("rate_limit", [0, -1])
+    def test_non_positive_rate_limit_rejected(self, rate_limit):
+        """Test the token bucket refuses rates it could never refill at."""
+        with pytest.raises(ValueError):
+            DexScreenerClient(rate_limit=rate_limit)
+    
     @pytest.mark.asyncio
     async def test_cache_key_generation(self, client):
         """Test cache key generation."""
         key1 = client._get_cache_key("/tokens/0x123")
         key2 = client._get_cache_key("/search", {"q": "usdc", "limit": "10"})
+        key3 = client._get_cache_key("/search", {"limit": "10", "q": "usdc"})
         
         assert key1 == "/tokens/0x123"
-        assert key2 == "/search?limit=10&q=usdc"
+        assert key2 == ("/search", frozenset({("q", "usdc"), ("limit", "10")}))
+        assert key2 == key3
+        assert hash(client._get_cache_key("/pairs", {"ids": ["a", "b"]}))
     
     @pytest.mark.asyncio
     async def test_cache_functionality(self, client):
@@ -49,11 +78,39 @@ class TestDexScreenerClient:
         client._cache_data(cache_key, test_data)
         assert client._get_cached_data(cache_key) == test_data
         
-        # Test cache validation
-        assert client._is_cache_valid(cache_key) is True
+        # Test cache expiry
+        client._cache_data(cache_key, test_data, ttl=0)
+        assert client._get_cached_data(cache_key) is None
+        assert cache_key not in client._cache
+    
+    @pytest.mark.asyncio
+    async def test_cache_ttl_uses_monotonic_clock(self, client):
+        """Test cache expiry follows the monotonic clock, not wall time."""
+        with patch("dexscreener_mcp._cache.time.monotonic", return_value=100.0) as clock:
+            client._cache_data("key", {"test": "data"})
+            
+            clock.return_value = 109.0
+            assert client._get_cached_data("key") == {"test": "data"}
+            
+            clock.return_value = 110.0
+            assert client._get_cached_data("key") is None
+    
+    @pytest.mark.asyncio
+    async def test_cache_lru_eviction(self):
+        """Test least recently used entries are evicted at capacity."""
+        client = DexScreenerClient(max_cache_entries=2)
+        try:
+            client._cache_data("a", {"n": 1})
+            client._cache_data("b", {"n": 2})
+            client._get_cached_data("a")
+            client._cache_data("c", {"n": 3})
+            
+            assert list(client._cache) == ["a", "c"]
+        finally:
+            await client.close()
     
     @pytest.mark.asyncio
-    async def test_get_token_info_success(self, client):
+    async def test_get_token_info_success(self, client, mock_fetch):
         """Test successful token info retrieval."""
         mock_response = {
             "pairs": [
@@ -74,20 +131,97 @@ class TestDexScreenerClient:
                         "symbol": "USDC",
                         "decimals": 6
                     },
-                    "priceUsd": "1.50"
+                    "priceUsd": "1.50",
+                    "pairCreatedAt": 1700000000000
                 }
             ]
         }
         
-        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = mock_response
-            
-            result = await client.get_token_info("0xabc")
-            
-            assert isinstance(result, TokenResponse)
-            assert len(result.pairs) == 1
-            assert result.pairs[0].base_token.symbol == "TEST"
-            mock_request.assert_called_once_with("tokens/0xabc")
+        mock_fetch.return_value = json.dumps(mock_response).encode()
+        
+        result = await client.get_token_info("0xabc")
+        
+        assert isinstance(result, TokenResponse)
+        assert len(result.pairs) == 1
+        assert result.pairs[0].base_token.symbol == "TEST"
+        assert result.pairs[0].pair_created_at == datetime.fromtimestamp(1700000000)
+        mock_fetch.assert_called_once_with("tokens/0xabc", None)
+        
+        # Cache hits return the already validated model
+        assert await client.get_token_info("0xabc") is result
+        mock_fetch.assert_called_once()
+        
+        with pytest.raises(ValidationError):
+            result.pairs = []
+    
+    def test_models_accept_field_names(self):
+        """Test models can be built from field names as well as API aliases."""
+        token = {"address": "0xabc", "name": "Test Token", "symbol": "TEST"}
+        pair = PairInfo(
+            chain_id="ethereum",
+            dex_id="uniswap",
+            url="https://dexscreener.com/ethereum/0x123",
+            pair_address="0x123",
+            base_token=token,
+            quote_token=token,
+        )
+        
+        assert pair.chain_id == "ethereum"
+        assert pair.base_token.symbol == "TEST"
+    
+    @pytest.mark.asyncio
+    async def test_make_request_parses_response(self, client):
+        """Test HTTP responses are decoded and cached."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, content=b'{"pairs": []}')
+        
+        await _install_transport(client, handler)
+        
+        assert await client._make_request("tokens/0xabc") == {"pairs": []}
+        assert await client._make_request("tokens/0xabc") == {"pairs": []}
+        assert len(calls) == 1
+        assert calls[0].url == f"{client.BASE_URL}/tokens/0xabc"
+    
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(self, client):
+        """Test permanent 4xx responses fail fast and are negative-cached."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404, text="Not Found")
+        
+        await _install_transport(client, handler)
+        
+        with pytest.raises(DexScreenerAPIError) as exc_info:
+            await client._make_request("tokens/0xinvalid")
+        
+        assert exc_info.value.status_code == 404
+        assert len(calls) == 1
+        
+        # Repeated lookups are served from the negative cache
+        with pytest.raises(DexScreenerAPIError) as exc_info:
+            await client._make_request("tokens/0xinvalid")
+        
+        assert exc_info.value.status_code == 404
+        assert len(calls) == 1
+    
+    @pytest.mark.asyncio
+    async def test_server_errors_retried(self, client):
+        """Test 5xx responses are retried with backoff."""
+        statuses = [503, 200]
+        
+        def handler(request):
+            return httpx.Response(statuses.pop(0), content=b'{"pairs": []}')
+        
+        await _install_transport(client, handler)
+        
+        with patch("dexscreener_mcp.client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            assert await client._make_request("tokens/0xabc") == {"pairs": []}
+            mock_sleep.assert_called_once_with(1)
     
     @pytest.mark.asyncio
     async def test_api_error_handling(self, client):
@@ -102,16 +236,118 @@ class TestDexScreenerClient:
             assert "API Error" in str(exc_info.value)
     
     @pytest.mark.asyncio
-    async def test_search_with_limit(self, client):
+    async def test_search_with_limit(self, client, mock_fetch):
         """Test search functionality with limit."""
         mock_response = {"pairs": []}
         
-        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = mock_response
+        mock_fetch.return_value = json.dumps(mock_response).encode()
+        
+        await client.search("USDC", limit=10)
+        
+        mock_fetch.assert_called_once_with("search", {"q": "USDC", "limit": "10"})
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_coalesced(self, client):
+        """Test concurrent identical requests share one API call."""
+        release = asyncio.Event()
+        
+        async def fake_fetch(endpoint, params):
+            await release.wait()
+            return b'{"pairs": []}'
+        
+        with patch.object(client, '_fetch', side_effect=fake_fetch) as mock_fetch:
+            tasks = [
+                asyncio.create_task(client._make_request("tokens/0xabc"))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+            
+            assert results == [{"pairs": []}] * 3
+            mock_fetch.assert_called_once()
+            assert client._cache.inflight == 0
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_joiners(self, client):
+        """Test cancelling the caller that started a request leaves others waiting."""
+        release = asyncio.Event()
+        
+        async def fake_fetch(endpoint, params):
+            await release.wait()
+            return b'{"pairs": []}'
+        
+        with patch.object(client, '_fetch', side_effect=fake_fetch) as mock_fetch:
+            leader = asyncio.create_task(client._make_request("tokens/0xabc"))
+            await asyncio.sleep(0)
+            joiner = asyncio.create_task(client._make_request("tokens/0xabc"))
+            await asyncio.sleep(0)
+            
+            leader.cancel()
+            release.set()
+            
+            assert await joiner == {"pairs": []}
+            assert leader.cancelled()
+            mock_fetch.assert_called_once()
+            assert client._cache.inflight == 0
+    
+    @pytest.mark.asyncio
+    async def test_expired_key_refreshed_once(self, client):
+        """Test concurrent callers hitting an expired key trigger one refresh."""
+        client._cache_data("tokens/0xabc", {"pairs": ["stale"]}, ttl=0)
+        
+        async def fake_fetch(endpoint, params):
+            await asyncio.sleep(0)
+            return b'{"pairs": []}'
+        
+        with patch.object(client, '_fetch', side_effect=fake_fetch) as mock_fetch:
+            results = await asyncio.gather(
+                *(client._make_request("tokens/0xabc") for _ in range(5))
+            )
+            
+            assert results == [{"pairs": []}] * 5
+            mock_fetch.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_get_multiple_pairs_chunks_requests(self, client, mock_fetch):
+        """Test pair lists are grouped by chain and split into capped requests."""
+        eth = [f"0x{i}" for i in range(65)]
+        addresses = [f"ethereum:{a}" for a in eth] + ["bsc:0xb1", "bsc:0xb2"]
+        
+        mock_fetch.return_value = b'{"pairs": []}'
+        
+        assert await client.get_multiple_pairs(addresses) == []
+        
+        endpoints = [call.args[0] for call in mock_fetch.call_args_list]
+        assert endpoints == [
+            "pairs/ethereum/" + ",".join(eth[:30]),
+            "pairs/ethereum/" + ",".join(eth[30:60]),
+            "pairs/ethereum/" + ",".join(eth[60:]),
+            "pairs/bsc/0xb1,0xb2",
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_get_multiple_pairs_invalid_address(self, client):
+        """Test addresses without a chain prefix are rejected."""
+        with pytest.raises(ValueError):
+            await client.get_multiple_pairs(["0xabc"])
+    
+    @pytest.mark.asyncio
+    async def test_token_bucket_waits_when_empty(self, client):
+        """Test the rate limiter sleeps once the bucket is drained."""
+        client._tokens = 0.0
+        client._last_refill = time.monotonic()
+        
+        with patch("dexscreener_mcp.client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            async def refill(delay):
+                client._tokens = 1.0
             
-            await client.search("USDC", limit=10)
+            mock_sleep.side_effect = refill
+            await client._acquire()
             
-            mock_request.assert_called_once_with("search", {"q": "USDC", "limit": "10"})
+            mock_sleep.assert_called_once()
+            assert mock_sleep.call_args.args[0] == pytest.approx(1.0, abs=0.01)
+            assert client._tokens < 1
     
     @pytest.mark.asyncio
     async def test_rate_limit_info(self, client):
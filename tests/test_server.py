@@ -0,0 +1,378 @@
+"""
+Tests for DexScreener MCP server.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+from mcp.types import CallToolRequest, CallToolRequestParams, ListToolsRequest
+
+from dexscreener_mcp.client import DexScreenerAPIError, DexScreenerClient
+from dexscreener_mcp.server import DexScreenerMCPServer
+from dexscreener_mcp.types import PairInfo, PairResponse, SearchResult, TokenResponse
+
+
+class TestDexScreenerMCPServer:
+    """Test cases for DexScreener MCP server."""
+    
+    @pytest.fixture
+    async def server(self):
+        """Create test server."""
+        server = DexScreenerMCPServer()
+        yield server
+        if server.client:
+            await server.client.close()
+    
+    async def _list_tools(self, server):
+        handler = server.server.request_handlers[ListToolsRequest]
+        result = await handler(ListToolsRequest(method="tools/list"))
+        return result.root.tools
+    
+    async def _call_tool(self, server, name, arguments=None):
+        handler = server.server.request_handlers[CallToolRequest]
+        request = CallToolRequest(
+            method="tools/call",
+            params=CallToolRequestParams(name=name, arguments=arguments or {}),
+        )
+        return (await handler(request)).root
+    
+    @pytest.mark.asyncio
+    async def test_list_tools(self, server):
+        """Test all tools are listed and reused between calls."""
+        tools = await self._list_tools(server)
+        
+        assert [tool.name for tool in tools] == [
+            "get_token_info",
+            "get_pair_info",
+            "search_tokens",
+            "get_trending_pairs",
+            "get_multiple_pairs",
+            "get_supported_chains",
+            "get_rate_limit_info",
+        ]
+        assert (await self._list_tools(server))[0] is tools[0]
+        
+        # Argument-less tools share one empty schema's nested objects
+        assert tools[5].inputSchema == {"type": "object", "properties": {}, "required": []}
+        assert tools[5].inputSchema["properties"] is tools[6].inputSchema["properties"]
+    
+    @pytest.mark.asyncio
+    async def test_call_tool_dispatch(self, server):
+        """Test tool calls are routed to their handler."""
+        result = await self._call_tool(server, "get_supported_chains")
+        
+        assert not result.isError
+        chains = json.loads(result.content[0].text)["supported_chains"]
+        assert chains[0]["id"] == "ethereum"
+        assert await self._call_tool(server, "get_supported_chains") is result
+    
+    @pytest.mark.asyncio
+    async def test_call_unknown_tool(self, server):
+        """Test unknown tools return an error result."""
+        result = await self._call_tool(server, "unknown_tool")
+        
+        assert result.isError
+        assert "Unknown tool: unknown_tool" in result.content[0].text
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit_info_serialized(self, server):
+        """Test model results are dumped to JSON-compatible values."""
+        result = await self._call_tool(server, "get_rate_limit_info")
+        
+        data = json.loads(result.content[0].text)
+        assert data["limit"] == 300
+        assert isinstance(data["reset_time"], str)
+    
+    @pytest.mark.asyncio
+    async def test_read_only_results_cached(self, server):
+        """Test repeated read-only tool calls reuse the serialized result."""
+        server.client = DexScreenerClient()
+        
+        with patch.object(server.client, 'get_token_info', new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = TokenResponse(pairs=[])
+            
+            first = await self._call_tool(server, "get_token_info", {"token_address": "0xabc"})
+            second = await self._call_tool(server, "get_token_info", {"token_address": "0xabc"})
+            
+            assert first.content[0].text == second.content[0].text
+            mock_get.assert_called_once_with("0xabc")
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_tool_calls_coalesced(self, server):
+        """Test concurrent identical tool calls share one handler run."""
+        server.client = DexScreenerClient()
+        
+        async def slow_get(token_address):
+            await asyncio.sleep(0)
+            return TokenResponse(pairs=[])
+        
+        with patch.object(server.client, 'get_token_info', side_effect=slow_get) as mock_get:
+            results = await asyncio.gather(
+                *(
+                    self._call_tool(server, "get_token_info", {"token_address": "0xabc"})
+                    for _ in range(3)
+                )
+            )
+            
+            assert not any(result.isError for result in results)
+            mock_get.assert_called_once_with("0xabc")
+            assert server._result_cache.inflight == 0
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_tool_call_does_not_cancel_joiners(self, server):
+        """Test cancelling the first of two identical tool calls keeps the other."""
+        server.client = DexScreenerClient()
+        release = asyncio.Event()
+        
+        async def slow_get(token_address):
+            await release.wait()
+            return TokenResponse(pairs=[])
+        
+        with patch.object(server.client, 'get_token_info', side_effect=slow_get) as mock_get:
+            arguments = {"token_address": "0xabc"}
+            leader = asyncio.create_task(self._call_tool(server, "get_token_info", arguments))
+            await asyncio.sleep(0)
+            joiner = asyncio.create_task(self._call_tool(server, "get_token_info", arguments))
+            await asyncio.sleep(0)
+            
+            leader.cancel()
+            release.set()
+            
+            result = await joiner
+            assert not result.isError
+            assert json.loads(result.content[0].text) == {"pairs": []}
+            mock_get.assert_called_once_with("0xabc")
+    
+    @pytest.mark.asyncio
+    async def test_search_tokens_paginated(self, server):
+        """Test search results are sliced to the requested page."""
+        server.client = DexScreenerClient()
+        pair = {
+            "chainId": "ethereum",
+            "dexId": "uniswap",
+            "url": "https://dexscreener.com/ethereum/0x123",
+            "pairAddress": "0x123",
+            "baseToken": {"address": "0xabc", "name": "Test Token", "symbol": "TEST"},
+            "quoteToken": {"address": "0xdef", "name": "USD Coin", "symbol": "USDC"},
+        }
+        pairs = [dict(pair, pairAddress=f"0x{i}") for i in range(5)]
+        
+        with patch.object(server.client, 'search', new_callable=AsyncMock) as mock_search:
+            mock_search.return_value = SearchResult(pairs=pairs)
+            
+            result = await self._call_tool(
+                server, "search_tokens", {"query": "TEST", "limit": 2, "offset": 1}
+            )
+            
+            data = json.loads(result.content[0].text)
+            assert [p["pair_address"] for p in data["pairs"]] == ["0x1", "0x2"]
+            assert data["total"] == 5
+            mock_search.assert_called_once_with("TEST")
+            
+            # Without a limit every remaining match is returned
+            result = await self._call_tool(server, "search_tokens", {"query": "TEST", "offset": 3})
+            
+            data = json.loads(result.content[0].text)
+            assert [p["pair_address"] for p in data["pairs"]] == ["0x3", "0x4"]
+    
+    @pytest.mark.asyncio
+    async def test_pair_info_calls_batched(self, server):
+        """Test concurrent pair lookups are fetched with one multi-pair request."""
+        server.client = DexScreenerClient()
+        pair = {
+            "chainId": "ethereum",
+            "dexId": "uniswap",
+            "url": "https://dexscreener.com/ethereum/0x123",
+            "baseToken": {"address": "0xabc", "name": "Test Token", "symbol": "TEST"},
+            "quoteToken": {"address": "0xdef", "name": "USD Coin", "symbol": "USDC"},
+        }
+        
+        with patch.object(server.client, 'get_multiple_pairs', new_callable=AsyncMock) as mock_multi, \
+                patch.object(server.client, 'get_pair_info', new_callable=AsyncMock) as mock_single:
+            mock_multi.return_value = [
+                PairInfo.model_validate(dict(pair, pairAddress="0xAA")),
+                PairInfo.model_validate(dict(pair, pairAddress="0xbb")),
+            ]
+            mock_single.return_value = PairResponse(pair=None)
+            
+            results = await asyncio.gather(
+                *(
+                    self._call_tool(
+                        server, "get_pair_info", {"chain_id": "ethereum", "pair_address": address}
+                    )
+                    for address in ["0xaa", "0xbb", "0xcc"]
+                )
+            )
+            
+            pairs = [json.loads(result.content[0].text)["pair"] for result in results]
+            assert pairs[0]["pair_address"] == "0xAA"
+            assert pairs[1]["pair_address"] == "0xbb"
+            assert pairs[2] is None
+            mock_multi.assert_called_once_with(
+                ["ethereum:0xaa", "ethereum:0xbb", "ethereum:0xcc"]
+            )
+            
+            # A lone lookup still uses the single pair endpoint
+            await self._call_tool(
+                server, "get_pair_info", {"chain_id": "bsc", "pair_address": "0xdd"}
+            )
+            mock_single.assert_called_once_with("bsc", "0xdd")
+    
+    @pytest.mark.asyncio
+    async def test_pair_batch_matches_chain_and_address_case(self, server):
+        """Test batched results match chain ids loosely and base58 addresses exactly."""
+        server.client = DexScreenerClient()
+        pair = {
+            "dexId": "raydium",
+            "url": "https://dexscreener.com/solana/abc",
+            "baseToken": {"address": "So1", "name": "Test Token", "symbol": "TEST"},
+            "quoteToken": {"address": "So2", "name": "USD Coin", "symbol": "USDC"},
+        }
+        
+        with patch.object(server.client, 'get_multiple_pairs', new_callable=AsyncMock) as mock_multi:
+            mock_multi.return_value = [
+                PairInfo.model_validate(dict(pair, chainId="solana", pairAddress="AbC")),
+                PairInfo.model_validate(dict(pair, chainId="ethereum", pairAddress="0xdd")),
+            ]
+            
+            results = await asyncio.gather(
+                *(
+                    self._call_tool(
+                        server, "get_pair_info", {"chain_id": chain_id, "pair_address": address}
+                    )
+                    for chain_id, address in [
+                        ("Solana", "AbC"), ("Solana", "abc"), ("Ethereum", "0xDD"), ("Ethereum", "0xee")
+                    ]
+                )
+            )
+            
+            pairs = [json.loads(result.content[0].text)["pair"] for result in results]
+            assert pairs[0]["pair_address"] == "AbC"
+            assert pairs[1] is None
+            assert pairs[2]["pair_address"] == "0xdd"
+            assert pairs[3] is None
+    
+    @pytest.mark.asyncio
+    async def test_pair_batch_failure_isolated(self, server):
+        """Test one failing lookup in a batch doesn't fail the other callers."""
+        server.client = DexScreenerClient()
+        pair = {
+            "chainId": "ethereum",
+            "dexId": "uniswap",
+            "url": "https://dexscreener.com/ethereum/0x123",
+            "baseToken": {"address": "0xabc", "name": "Test Token", "symbol": "TEST"},
+            "quoteToken": {"address": "0xdef", "name": "USD Coin", "symbol": "USDC"},
+        }
+        
+        async def get_pair_info(chain_id, pair_address):
+            if chain_id == "nochain":
+                raise DexScreenerAPIError("HTTP 400: Bad Request", 400)
+            return PairResponse(pair=dict(pair, pairAddress=pair_address))
+        
+        with patch.object(server.client, 'get_multiple_pairs', new_callable=AsyncMock) as mock_multi, \
+                patch.object(server.client, 'get_pair_info', side_effect=get_pair_info):
+            mock_multi.side_effect = DexScreenerAPIError("HTTP 400: Bad Request", 400)
+            
+            results = await asyncio.gather(
+                *(
+                    self._call_tool(
+                        server, "get_pair_info", {"chain_id": chain_id, "pair_address": address}
+                    )
+                    for chain_id, address in [
+                        ("ethereum", "0xaa"), ("nochain", "0xbb"), ("ethereum", "0xcc")
+                    ]
+                )
+            )
+            
+            assert [result.isError for result in results] == [False, True, False]
+            assert json.loads(results[0].content[0].text)["pair"]["pair_address"] == "0xaa"
+            assert json.loads(results[2].content[0].text)["pair"]["pair_address"] == "0xcc"
+            assert "Status: 400" in results[1].content[0].text
+            mock_multi.assert_called_once()
+    
+    async def _install_pair_transport(self, server, handler):
+        """Route the server's client through a mock pairs endpoint."""
+        requests = []
+        
+        def record(request):
+            requests.append(request.url.path)
+            return handler(request)
+        
+        server.client = DexScreenerClient()
+        await server.client.client.aclose()
+        server.client.client = httpx.AsyncClient(
+            base_url=server.client.BASE_URL, transport=httpx.MockTransport(record)
+        )
+        return requests
+    
+    def _pairs_body(self, request):
+        """Build a pairs response echoing the requested chain and addresses."""
+        chain_id, addresses = request.url.path.split("/")[-2:]
+        pairs = [
+            {
+                "chainId": chain_id,
+                "dexId": "uniswap",
+                "url": f"https://dexscreener.com/{chain_id}/{address}",
+                "pairAddress": address,
+                "baseToken": {"address": "0xabc", "name": "Test Token", "symbol": "TEST"},
+                "quoteToken": {"address": "0xdef", "name": "USD Coin", "symbol": "USDC"},
+            }
+            for address in addresses.split(",")
+        ]
+        return {"pair": pairs[0], "pairs": pairs}
+    
+    async def _call_pairs(self, server, keys):
+        return await asyncio.gather(
+            *(
+                self._call_tool(
+                    server, "get_pair_info", {"chain_id": chain_id, "pair_address": address}
+                )
+                for chain_id, address in keys
+            )
+        )
+    
+    @pytest.mark.asyncio
+    async def test_pair_batch_bad_chain_requests(self, server):
+        """Test a bad chain in a batch doesn't refetch the other chains' pairs."""
+        def handler(request):
+            if "/pairs/nochain/" in request.url.path:
+                return httpx.Response(400, text="Bad Request")
+            return httpx.Response(200, json=self._pairs_body(request))
+        
+        requests = await self._install_pair_transport(server, handler)
+        keys = [("ethereum", f"0x0{i}") for i in range(10)] + [("nochain", "0xff")]
+        
+        results = await self._call_pairs(server, keys)
+        
+        assert [result.isError for result in results] == [False] * 10 + [True]
+        assert json.loads(results[3].content[0].text)["pair"]["pair_address"] == "0x03"
+        assert sorted(requests) == [
+            "/latest/dex/pairs/ethereum/" + ",".join(address for _, address in keys[:10]),
+            "/latest/dex/pairs/nochain/0xff",
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_pair_batch_transient_errors_not_refetched(self, server):
+        """Test a 503 batch is retried as one request, not once per key."""
+        requests = await self._install_pair_transport(
+            server, lambda request: httpx.Response(503, text="Unavailable")
+        )
+        keys = [("ethereum", f"0x0{i}") for i in range(5)]
+        
+        with patch("dexscreener_mcp.client.asyncio.sleep", new_callable=AsyncMock):
+            results = await self._call_pairs(server, keys)
+        
+        assert all(result.isError for result in results)
+        assert "Status: 503" in results[0].content[0].text
+        assert len(requests) == server.client.max_retries
+    
+    @pytest.mark.asyncio
+    async def test_invalid_arguments_rejected(self, server):
+        """Test tool arguments are validated before dispatch."""
+        result = await self._call_tool(server, "get_token_info", {"token_address": ""})
+        
+        assert result.isError
+        assert result.content[0].text.startswith("Validation Error")